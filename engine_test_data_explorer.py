@@ -1,65 +1,174 @@
 import os
+import csv
+import json
+import re
 import sys
 import traceback
+import warnings
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import numpy as np
 import pandas as pd
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.feather as feather
+except ImportError:  # fall back to pandas' C parser
+    pa = None
+    pacsv = None
+    feather = None
+
+try:
+    from numba import njit
+except ImportError:  # ISO timestamps are then parsed by pandas
+    njit = None
+
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QSplitter, QVBoxLayout, QHBoxLayout,
     QLineEdit, QPushButton, QLabel, QListWidget, QListWidgetItem, QGroupBox,
     QComboBox, QTableWidget, QTableWidgetItem, QAbstractItemView, QRadioButton,
     QCheckBox, QStatusBar, QAction, QToolBar, QFileDialog, QProgressBar,
-    QTabWidget, QSizePolicy, QMessageBox, QDialog, QMenu, QTableView, QHeaderView, QDateTimeEdit
+    QTabWidget, QSizePolicy, QMessageBox, QDialog, QMenu, QTableView, QHeaderView, QDateTimeEdit,
+    QInputDialog
+)
+from PyQt5.QtCore import (
+    Qt, QSettings, QSize, QTimer, QThread, pyqtSignal, QDateTime, QEvent, QAbstractTableModel, QModelIndex
 )
-from PyQt5.QtCore import Qt, QSettings, QSize, QTimer, QThread, pyqtSignal, QDateTime, QEvent
 from PyQt5.QtGui import QIcon, QCursor
 
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 
+# Files found while scanning are handed to the GUI in batches of this size
+SCAN_BATCH_SIZE = 256
+# Parsed files kept in memory between Plot/Export/Summary clicks (LRU)
+DF_CACHE_MAX_FILES = 32
+DF_CACHE_MAX_BYTES = 2 * 1024 ** 3
+# Parsed tables are also written next to the source file and reused while it is unchanged
+SIDECAR_EXT = ".feather"
+# Both parsers release the GIL, so files are parsed on a small thread pool
+MAX_LOAD_WORKERS = 8
+# Per-file summary reductions are numpy/numba work that runs without the GIL
+MAX_SUMMARY_WORKERS = 8
+
 # ==== File Discovery (Recursive) ====
 def find_data_files(root_folder, exts=('.txt', '.tsv')):
-    result = []
-    for dirpath, dirnames, filenames in os.walk(root_folder):
-        for fname in filenames:
-            if fname.lower().endswith(exts):
-                result.append(os.path.join(dirpath, fname))
-    return result
+    """Yields data files under root_folder as they are found, without following symlinked folders."""
+    exts = tuple(e.lower() for e in exts)
+    stack = [root_folder]
+    while stack:
+        subdirs = []
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                        elif entry.name.lower().endswith(exts):
+                            yield entry.path
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+        # Reversed so folders are visited in listing order, like os.walk
+        stack.extend(reversed(subdirs))
 
 class FolderScanThread(QThread):
-    finished = pyqtSignal(list)
+    batch = pyqtSignal(list)
+    finished = pyqtSignal(int)
     def __init__(self, folder):
         super().__init__()
         self.folder = folder
     def run(self):
-        files = find_data_files(self.folder)
-        self.finished.emit(files)
+        found = 0
+        pending = []
+        for path in find_data_files(self.folder):
+            pending.append(path)
+            if len(pending) >= SCAN_BATCH_SIZE:
+                found += len(pending)
+                self.batch.emit(pending)
+                pending = []
+        if pending:
+            found += len(pending)
+            self.batch.emit(pending)
+        self.finished.emit(found)
+
+# ==== Background DataFrame Loading ====
+class DataLoadThread(QThread):
+    progress = pyqtSignal(int, int)    # files done, files total
+    finished = pyqtSignal(object, list)  # {filepath: (mtime, columns, DataFrame)}, error messages
+    def __init__(self, to_load, decimal_sep):
+        super().__init__()
+        self.to_load = to_load  # [(filepath, mtime, columns or None for all)]
+        self.decimal_sep = decimal_sep
+    def run(self):
+        parsed = {}
+        errors = []
+        total = len(self.to_load)
+        n_workers = min(MAX_LOAD_WORKERS, os.cpu_count() or 1, total)
+        # Queue readahead for every file up front so cold reads overlap with parsing
+        for f, mtime, _ in self.to_load:
+            sidecar = f + SIDECAR_EXT
+            try:
+                fresh_sidecar = feather is not None and \
+                    _sidecar_info(sidecar, source_stamp(f), self.decimal_sep) is not None
+            except OSError:
+                fresh_sidecar = False
+            prefetch_file(sidecar if fresh_sidecar else f)
+        with ThreadPoolExecutor(max_workers=n_workers) as ex:
+            futures = {ex.submit(self.load_file, f, columns): (f, mtime, columns)
+                       for f, mtime, columns in self.to_load}
+            for done, fut in enumerate(as_completed(futures), 1):
+                f, mtime, columns = futures[fut]
+                try:
+                    parsed[f] = (mtime, columns, fut.result())
+                except Exception as e:
+                    errors.append(f"{os.path.basename(f)}: {e}")
+                self.progress.emit(done, total)
+        self.finished.emit(parsed, errors)
+    def load_file(self, filepath, columns):
+        return shrink_dtypes(load_data_file(filepath, self.decimal_sep, columns))
 
 # ==== Header Preview Dialog ====
+class ArrayTableModel(QAbstractTableModel):
+    """Read-only model over a 2-D ndarray; cells are converted to text only when the view asks for them."""
+    def __init__(self, headers, values, parent=None):
+        super().__init__(parent)
+        self.headers = [str(h) for h in headers]
+        self.values = values
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.values.shape[0]
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.values.shape[1]
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid():
+            return str(self.values[index.row(), index.column()])
+        return None
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.headers[section]
+        return str(section + 1)
+
 class HeaderPreviewDialog(QDialog):
-    def __init__(self, filepaths, parent=None):
+    def __init__(self, filepaths, decimal_sep='.', parent=None):
         super().__init__(parent)
         self.setWindowTitle("Preview File Headers")
         layout = QVBoxLayout(self)
         tabs = QTabWidget(self)
-        decimal_sep = self.decimal_sep_combo.currentText()
         for filepath in filepaths:
             tab = QWidget()
             vbox = QVBoxLayout(tab)
-            table = QTableWidget()
+            table = QTableView()
             vbox.addWidget(table)
             try:
-                df = pd.read_csv(filepath, sep='\t', nrows=5, decimal=decimal_sep)
-                table.setRowCount(len(df))
-                table.setColumnCount(len(df.columns))
-                table.setHorizontalHeaderLabels(list(df.columns))
-                for i, row in df.iterrows():
-                    for j, val in enumerate(row):
-                        table.setItem(i, j, QTableWidgetItem(str(val)))
+                model = ArrayTableModel(*read_file_preview(filepath, decimal_sep), table)
             except Exception as e:
-                table.setRowCount(1)
-                table.setColumnCount(1)
-                table.setItem(0, 0, QTableWidgetItem(f"Failed: {e}"))
+                model = ArrayTableModel([""], np.array([[f"Failed: {e}"]], dtype=object), table)
+            table.setModel(model)
             tabs.addTab(tab, os.path.basename(filepath))
         layout.addWidget(tabs)
         btn = QPushButton("Close")
@@ -67,44 +176,437 @@ class HeaderPreviewDialog(QDialog):
         layout.addWidget(btn)
 
 # ==== Data Utilities ====
+_TIME_RE = re.compile(r"time|zaman|date", re.IGNORECASE)
+
 def is_time_col(col):
-    return any(x in col.lower() for x in ["time", "zaman", "date"])
+    return _TIME_RE.search(col) is not None
 
-def read_file_headers(files):
-    headers = {}
-    for f in files:
+# Plain decimal numbers as typed into the time window fields (seconds)
+_FLOAT_RE = re.compile(r"^[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?$")
+
+def _arrow_csv_options(decimal_sep='.', include_columns=None, short_rows=None):
+    """Arrow parse/convert options; rows with the wrong field count are skipped and their text
+    appended to short_rows, so the caller can decide whether that was acceptable."""
+    def skip_row(row):
+        if short_rows is not None:
+            short_rows.append(row.text)
+        return "skip"
+    parse_options = pacsv.ParseOptions(delimiter='\t', invalid_row_handler=skip_row)
+    convert_options = pacsv.ConvertOptions(decimal_point=decimal_sep)
+    if include_columns is not None:
+        convert_options.include_columns = include_columns
+    return parse_options, convert_options
+
+def _arrow_read_options(filepath, **kwargs):
+    """ReadOptions that give a file with a repeated header name unique column names.
+
+    Arrow keeps duplicates as they are, which breaks column lookups; the names are taken from
+    pandas instead (P, P.1, …) so both readers and the sidecars agree.
+    """
+    with open(filepath, newline='', encoding='utf-8-sig', errors='replace') as fh:
+        header = next(csv.reader(fh, delimiter='\t'), [])
+    if len(set(header)) == len(header):
+        return pacsv.ReadOptions(**kwargs)
+    names = list(pd.read_csv(filepath, sep='\t', nrows=0).columns)
+    return pacsv.ReadOptions(column_names=names, skip_rows=1, **kwargs)
+
+def open_data_file(filepath, decimal_sep='.', block_size=1 << 16, short_rows=None):
+    """Opens a streaming Arrow reader; only the first block is parsed until batches are pulled."""
+    parse_options, convert_options = _arrow_csv_options(decimal_sep, short_rows=short_rows)
+    return pacsv.open_csv(filepath,
+                          read_options=_arrow_read_options(filepath, block_size=block_size),
+                          parse_options=parse_options,
+                          convert_options=convert_options)
+
+def _last_line(filepath, tail=1 << 16):
+    """Last non-empty line of a file, read from its tail only."""
+    with open(filepath, 'rb') as fh:
+        fh.seek(0, os.SEEK_END)
+        fh.seek(max(0, fh.tell() - tail))
+        lines = [ln for ln in fh.read().splitlines() if ln.strip()]
+    return lines[-1].decode('utf-8', errors='replace') if lines else ""
+
+def _read_csv_pandas(filepath, decimal_sep='.', columns=None, **kwargs):
+    usecols = None if columns is None else (lambda c: c in columns)
+    return pd.read_csv(filepath, sep='\t', decimal=decimal_sep, usecols=usecols, **kwargs)
+
+def _read_data_table(filepath, decimal_sep='.', columns=None):
+    if columns is not None:
+        # Arrow wants an explicit list of existing names; an empty list would mean "all"
+        columns = [c for c in open_data_file(filepath).schema.names if c in columns]
+        if not columns:
+            return None
+    short_rows = []
+    parse_options, convert_options = _arrow_csv_options(decimal_sep, columns, short_rows)
+    table = pacsv.read_csv(filepath, read_options=_arrow_read_options(filepath),
+                           parse_options=parse_options, convert_options=convert_options)
+    # Only a last line cut short by a stopped logger may be dropped; short rows elsewhere are
+    # real samples, which the pandas reader keeps with NaN in the missing fields
+    if short_rows and short_rows != [_last_line(filepath)]:
+        df = _read_csv_pandas(filepath, decimal_sep, columns, engine='c', low_memory=False)
+        return pa.Table.from_pandas(df, preserve_index=False)
+    # HH:MM:SS columns are inferred as Arrow time types, which pandas turns into datetime.time
+    # objects; keep them as text, as the pandas reader does, so they still parse as timestamps
+    for i, fld in enumerate(table.schema):
+        if pa.types.is_time(fld.type):
+            table = table.set_column(i, fld.name, table.column(i).cast(pa.string()))
+    return table
+
+def read_data_file(filepath, decimal_sep='.', columns=None):
+    """Reads a whole tab-separated file in a single call, optionally only the given columns."""
+    if pacsv is None:
+        return _read_csv_pandas(filepath, decimal_sep, columns, engine='c', cache_dates=True, low_memory=False)
+    table = _read_data_table(filepath, decimal_sep, columns)
+    if table is None:
+        return pd.DataFrame()
+    return table.to_pandas(self_destruct=True, zero_copy_only=False)
+
+def prefetch_file(filepath):
+    """Asks the kernel to start reading a file into the page cache in the background (POSIX only)."""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(filepath, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+def source_stamp(filepath):
+    """Exact modification time and size of a file, as stored in the metadata of its sidecar."""
+    st = os.stat(filepath)
+    return f"{st.st_mtime_ns}:{st.st_size}".encode()
+
+def _sidecar_info(sidecar, stamp, decimal_sep):
+    """(column names, requested columns or None for all) of a usable sidecar, else None.
+
+    The sidecar must have been written from a source with exactly this stamp; a copy that keeps
+    an older modification time (cp -p, unzip) does not match.
+    """
+    try:
+        schema = pa.ipc.open_file(sidecar).schema
+    except Exception:
+        return None
+    meta = schema.metadata or {}
+    if meta.get(b"source_stamp") != stamp or meta.get(b"decimal_sep") != decimal_sep.encode():
+        return None
+    if len(set(schema.names)) != len(schema.names):
+        # Columns can't be selected by name from such a sidecar
+        return None
+    requested = json.loads(meta.get(b"requested_columns", b"null"))
+    return schema.names, (None if requested is None else frozenset(requested))
+
+def load_data_file(filepath, decimal_sep='.', columns=None):
+    """read_data_file through a Feather sidecar next to the source file, when pyarrow is available."""
+    if feather is None:
+        return read_data_file(filepath, decimal_sep, columns)
+    sidecar = filepath + SIDECAR_EXT
+    stamp = source_stamp(filepath)
+    info = _sidecar_info(sidecar, stamp, decimal_sep)
+    if info is not None:
+        names, requested = info
+        if requested is None or (columns is not None and columns <= requested):
+            wanted = names if columns is None else [c for c in names if c in columns]
+            return feather.read_table(sidecar, columns=wanted).to_pandas(self_destruct=True)
+        if columns is not None:
+            # Grow the sidecar instead of replacing it with a narrower one
+            columns = columns | requested
+    table = _read_data_table(filepath, decimal_sep, columns)
+    if table is None:
+        return pd.DataFrame()
+    meta = dict(table.schema.metadata or {})
+    meta[b"source_stamp"] = stamp
+    meta[b"decimal_sep"] = decimal_sep.encode()
+    meta[b"requested_columns"] = json.dumps(None if columns is None else sorted(columns)).encode()
+    if len(set(table.column_names)) != len(table.column_names):
+        return table.to_pandas(self_destruct=True, zero_copy_only=False)
+    tmp = sidecar + ".tmp"
+    try:
+        feather.write_feather(table.replace_schema_metadata(meta), tmp, compression="lz4")
+        os.replace(tmp, sidecar)
+    except Exception:
+        # Read-only folders etc. just don't get a sidecar
         try:
-            df = pd.read_csv(f, sep='\t', nrows=1)
-            headers[f] = list(df.columns)
-        except Exception:
-            headers[f] = []
-    return headers
+            os.remove(tmp)
+        except OSError:
+            pass
+    return table.to_pandas(self_destruct=True, zero_copy_only=False)
+
+def shrink_dtypes(df):
+    """Downcasts floats to float32 and makes repetitive text categorical, for plots and summaries.
+
+    to_numeric's downcast accepts float32 within an absolute tolerance, so values are rounded;
+    exports re-read those columns at full precision. Time columns are left alone so their
+    resolution is not lost.
+    """
+    for c in df.select_dtypes(include='float').columns:
+        if not is_time_col(str(c)):
+            df[c] = pd.to_numeric(df[c], downcast='float')
+    n = len(df)
+    for c in df.select_dtypes(include=['object', 'string']).columns:
+        if n and not is_time_col(str(c)) and df[c].nunique() / n < 0.5:
+            df[c] = df[c].astype('category')
+    return df
 
-def unique_numeric_columns(files):
-    cols = set()
-    decimal_sep = self.decimal_sep_combo.currentText()
-    for f in files:
+def _is_arrow_numeric(dtype):
+    return pa.types.is_integer(dtype) or pa.types.is_floating(dtype) or pa.types.is_decimal(dtype)
+
+def read_file_preview(filepath, decimal_sep='.', nrows=5):
+    """(columns, 2-D object array) of the first rows of a file."""
+    short_rows = []
+    if pacsv is not None:
+        reader = open_data_file(filepath, decimal_sep, short_rows=short_rows)
+        names = reader.schema.names
         try:
-            df = pd.read_csv(f, sep='\t', nrows=10, decimal=decimal_sep)
-            for c in df.columns:
-                try:
-                    pd.to_numeric(df[c])
-                    cols.add(c)
-                except Exception:
-                    continue
-        except Exception:
-            continue
-    return sorted(list(cols))
+            batch = reader.read_next_batch().slice(0, nrows)
+        except StopIteration:
+            return names, np.empty((0, len(names)), dtype=object)
+    if pacsv is None or short_rows:
+        # Arrow skipped short rows; pandas shows them with empty fields
+        df = pd.read_csv(filepath, sep='\t', nrows=nrows, decimal=decimal_sep)
+        return list(df.columns), df.to_numpy(dtype=object)
+    values = np.empty((batch.num_rows, batch.num_columns), dtype=object)
+    for j in range(batch.num_columns):
+        values[:, j] = batch.column(j).to_pylist()
+    return names, values
 
-def extract_datetime_col(df, time_col):
+def sniff_file_columns(filepath, decimal_sep='.', nrows=10):
+    """Returns (all columns, numeric columns) of a file from its first rows."""
+    if pacsv is not None:
+        schema = open_data_file(filepath, decimal_sep).schema
+        return list(schema.names), [fld.name for fld in schema if _is_arrow_numeric(fld.type)]
+    df = pd.read_csv(filepath, sep='\t', nrows=nrows, decimal=decimal_sep)
+    return list(df.columns), list(df.select_dtypes(include='number').columns)
+
+# id(DataFrame): {time column: seconds Series}; an entry is dropped when its DataFrame is collected
+_dt_cache = {}
+_ISO_DT_RE = re.compile(r"^(?:\d{4}-\d{2}-\d{2}([ T]))?\d{2}:\d{2}:\d{2}(\.\d+)?$")
+
+def datetime_format_hint(values):
+    """strftime format for ISO-like timestamp (or bare HH:MM:SS) strings, judged from the first non-null value."""
+    if not (pd.api.types.is_object_dtype(values) or pd.api.types.is_string_dtype(values)):
+        return None
+    first = values.first_valid_index()
+    if first is None:
+        return None
+    m = _ISO_DT_RE.match(str(values[first]).strip())
+    if m is None:
+        return None
+    date = "%Y-%m-%d" + m.group(1) if m.group(1) else ""
+    return date + "%H:%M:%S" + (".%f" if m.group(2) else "")
+
+def _datetime_col_seconds(values):
+    if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+        # Already seconds (or another numeric clock): no datetime parsing at all
+        arr = values.to_numpy(dtype=np.float64, na_value=np.nan)
+        return pd.Series(arr - arr[0] if len(arr) else arr, index=values.index, name=values.name)
     try:
-        t = pd.to_datetime(df[time_col])
+        fmt = datetime_format_hint(values)
+        try:
+            t = pd.to_datetime(values, format=fmt, cache=True)
+        except (ValueError, TypeError):
+            if fmt is None:
+                raise
+            t = pd.to_datetime(values, cache=True)
         t0 = t.iloc[0]
         dt_sec = (t - t0).dt.total_seconds()
         return dt_sec
     except Exception:
         # Try convert to numeric as fallback
-        return pd.to_numeric(df[time_col], errors="coerce")
+        return pd.to_numeric(values, errors="coerce")
+
+def extract_datetime_col(df, time_col):
+    """Seconds since the first sample; computed once per DataFrame and time column."""
+    per_df = _dt_cache.get(id(df))
+    if per_df is not None and time_col in per_df:
+        return per_df[time_col]
+    dt_sec = _datetime_col_seconds(df[time_col])
+    if per_df is None:
+        per_df = _dt_cache[id(df)] = {}
+        weakref.finalize(df, _dt_cache.pop, id(df), None)
+    per_df[time_col] = dt_sec
+    return dt_sec
+
+# Summary metrics as NaN-skipping reductions of a non-empty float64 block along its first axis
+METRIC_FNS = {
+    "mean": lambda a: np.nanmean(a, axis=0),
+    "median": lambda a: np.nanmedian(a, axis=0),
+    "min": lambda a: np.nanmin(a, axis=0),
+    "max": lambda a: np.nanmax(a, axis=0),
+    "std": lambda a: np.nanstd(a, axis=0, ddof=1),
+}
+
+def _nan_moments(block, out):
+    n_rows, n_cols = block.shape
+    for j in range(n_cols):
+        n = 0
+        shift = 0.0
+        s1 = 0.0
+        s2 = 0.0
+        lo = np.nan
+        hi = np.nan
+        for i in range(n_rows):
+            v = block[i, j]
+            if v == v:
+                # Sums of deviations from the first value keep the variance stable without a per-row division
+                if n == 0:
+                    shift = v
+                n += 1
+                d = v - shift
+                s1 += d
+                s2 += d * d
+                # Comparisons with the initial NaN are False, so the first value always lands
+                if not lo <= v:
+                    lo = v
+                if not hi >= v:
+                    hi = v
+        out[0, j] = lo
+        out[1, j] = hi
+        out[2, j] = shift + s1 / n if n > 0 else np.nan
+        out[3, j] = np.sqrt(max(s2 - s1 * s1 / n, 0.0) / (n - 1)) if n > 1 else np.nan
+
+if njit is not None:
+    _nan_moments = njit(cache=True, nogil=True)(_nan_moments)
+
+FUSED_METRICS = ("min", "max", "mean", "std")
+# The fused kernel only beats numpy's vectorised reductions when it replaces at least this many of them
+FUSED_MIN_METRICS = 3
+
+def nan_moments(block):
+    """Column-wise NaN-skipping min, max, mean and std (ddof=1) of a 2-D float64 block in one pass; needs numba."""
+    out = np.empty((len(FUSED_METRICS), block.shape[1]))
+    _nan_moments(np.asfortranarray(block), out)
+    # Deviations from an infinite value are NaN; numpy gives inf (or NaN for mixed signs)
+    inf = np.isinf(out[0]) | np.isinf(out[1])
+    if inf.any():
+        out[2, inf] = np.nanmean(block[:, inf], axis=0)
+        out[3, inf] = np.nanstd(block[:, inf], axis=0, ddof=1)
+    return dict(zip(FUSED_METRICS, out))
+
+def time_window_rows(tsec, start, end):
+    """Rows with start <= t <= end: a slice found by binary search when t is sorted, else their positions."""
+    if start is None and end is None:
+        return slice(None)
+    if tsec.size < 2 or np.all(tsec[1:] >= tsec[:-1]):
+        lo = 0 if start is None else int(np.searchsorted(tsec, start, 'left'))
+        hi = tsec.size if end is None else int(np.searchsorted(tsec, end, 'right'))
+        return slice(lo, hi)
+    mask = np.ones(tsec.size, dtype=bool)
+    if start is not None:
+        mask &= tsec >= start
+    if end is not None:
+        mask &= tsec <= end
+    return np.flatnonzero(mask)
+
+def summarize_columns(df, cols, rows, metric_types, out=None, dtype=np.float64):
+    """Metrics of the selected rows (slice or row positions) as a flat array ordered col1-metric1, col1-metric2, …
+
+    df is expected to hold numeric columns already. The present columns of the window are
+    gathered into one float64 block with a single positional take, so each metric is a single
+    reduction over all columns. Missing columns and empty windows give NaN without touching the frame.
+    If out is given (a contiguous float64 row) the result is written into it. dtype=np.float32
+    halves the memory the reductions scan, at the cost of precision.
+    """
+    if out is None:
+        out = np.empty(len(cols) * len(metric_types))
+    out[:] = np.nan
+    flat, out = out, out.reshape(len(cols), len(metric_types))
+    if isinstance(rows, slice):
+        empty = len(range(len(df))[rows]) == 0
+    else:
+        empty = rows.size == 0
+    if empty:
+        return flat
+    # One hashed lookup for every requested column; -1 marks columns the file lacks
+    idx = df.columns.get_indexer(cols)
+    found = idx >= 0
+    if found.any():
+        pos = np.unique(idx[found])
+        block = df.iloc[rows, pos].to_numpy(dtype=dtype)
+        reduced = {}
+        if njit is not None and len(set(metric_types) & set(FUSED_METRICS)) >= FUSED_MIN_METRICS:
+            # One scan of the block instead of one numpy reduction per metric; median still sorts
+            reduced = nan_moments(block)
+        # Metric names are resolved to their reductions once per block
+        fns = [None if mt in reduced else METRIC_FNS.get(mt) for mt in metric_types]
+        stats = np.full((len(metric_types), len(pos)), np.nan)
+        for k, (mt, fn) in enumerate(zip(metric_types, fns)):
+            if fn is not None:
+                stats[k] = fn(block)
+            elif mt in reduced:
+                stats[k] = reduced[mt]
+        out[found] = stats[:, np.searchsorted(pos, idx[found])].T
+    return flat
+
+# ==== Plot Downsampling ====
+# Lines longer than twice this are reduced before plotting; exports keep full resolution
+PLOT_MAX_POINTS = 4000
+
+def _lttb_buckets(t, y, edges, idx):
+    n = len(y)
+    a = 0
+    for i in range(len(idx) - 2):
+        lo, hi = edges[i], edges[i + 1]
+        nhi = edges[i + 2] if i + 2 < len(edges) else n
+        # NaN-skipping averages of the next bucket
+        st = 0.0
+        sy = 0.0
+        ct = 0
+        cy = 0
+        for k in range(hi, nhi):
+            if t[k] == t[k]:
+                st += t[k]
+                ct += 1
+            if y[k] == y[k]:
+                sy += y[k]
+                cy += 1
+        avg_t = st / ct if ct else np.nan
+        avg_y = sy / cy if cy else np.nan
+        # First largest area wins; NaN areas never compare greater
+        best = -1.0
+        pick = lo
+        for k in range(lo, hi):
+            area = abs((t[a] - avg_t) * (y[k] - y[a]) - (t[a] - t[k]) * (avg_y - y[a]))
+            if area > best:
+                best = area
+                pick = k
+        a = pick
+        idx[i + 1] = a
+
+if njit is not None:
+    _lttb_buckets = njit(cache=True)(_lttb_buckets)
+
+def largest_triangle_three_buckets(t, y, n_out):
+    """Indices of n_out points picked by Largest-Triangle-Three-Buckets, which keeps peaks that striding drops."""
+    n = len(y)
+    idx = np.empty(n_out, dtype=np.intp)
+    idx[0], idx[-1] = 0, n - 1
+    # n_out - 2 buckets over the interior points; the last bucket's neighbour is the final point
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    if njit is not None:
+        _lttb_buckets(t, y, edges, idx)
+        return idx
+    a = 0
+    with np.errstate(invalid="ignore"):
+        for i in range(n_out - 2):
+            lo, hi = edges[i], edges[i + 1]
+            nhi = edges[i + 2] if i + 2 < len(edges) else n
+            avg_t = np.nanmean(t[hi:nhi])
+            avg_y = np.nanmean(y[hi:nhi])
+            area = np.abs((t[a] - avg_t) * (y[lo:hi] - y[a]) - (t[a] - t[lo:hi]) * (avg_y - y[a]))
+            a = lo if np.isnan(area).all() else lo + int(np.nanargmax(area))
+            idx[i + 1] = a
+    return idx
+
+def downsample_series(t, y, target=PLOT_MAX_POINTS):
+    if len(y) <= 2 * target:
+        return t, y
+    idx = largest_triangle_three_buckets(t, y, target)
+    return t[idx], y[idx]
 
 # ==== Main Window ====
 class EngineTestDataExplorer(QMainWindow):
@@ -114,11 +616,23 @@ class EngineTestDataExplorer(QMainWindow):
         self.setMinimumSize(1280, 750)
         self.settings = QSettings("ChatGPT", "EngineTestDataExplorer")
         self.file_list_data = []
+        self._file_basenames_lower = []  # parallel to file_list_data, for filtering
+        self._basenames = {}  # filename: base name for list items, plot labels and summary rows
         self.filtered_files = []
+        self._checked_paths = set()
         self.scanning = False
+        self.loading = False
         self.loaded_dfs = {}  # filename: DataFrame
+        self._df_cache = OrderedDict()  # filename: (mtime, decimal_sep, columns read or None, DataFrame)
+        self._header_cache = {}  # filename: (mtime, decimal_sep, (columns, numeric columns))
+        self._numeric_cache = {}  # filename: (source DataFrame, numeric columns for summaries)
+        self._last_summary = None  # (inputs, source DataFrames, (file names, columns, values))
         self.axis_rows = []   # for dynamic axes
         self.axis_map = []    # [(axis_name, column_name)]
+        self._plot_layout = None   # (overlay, axis_map, series) of the figure currently drawn
+        self._line_artists = {}    # (axis index, column, filename): Line2D
+        self._plot_axes = []
+        self._plot_arrays = None   # (time column and series, DataFrames, arrays) of the last plot
 
         # Central Layout
         central_widget = QWidget(self)
@@ -136,6 +650,10 @@ class EngineTestDataExplorer(QMainWindow):
         self.right_splitter.addWidget(self.plot_pane)
         self.status_bar = QStatusBar(self)
         self.setStatusBar(self.status_bar)
+        self.load_progress_bar = QProgressBar()
+        self.load_progress_bar.setMaximumWidth(200)
+        self.status_bar.addPermanentWidget(self.load_progress_bar)
+        self.load_progress_bar.hide()
         self.init_menus_and_toolbars()
         self.restore_window_settings()
         self.init_dynamic_axis_table()
@@ -145,7 +663,7 @@ class EngineTestDataExplorer(QMainWindow):
         self.btn_reload_folder.clicked.connect(self.reload_folder)
         self.btn_select_all.clicked.connect(self.select_all_files)
         self.btn_deselect_all.clicked.connect(self.deselect_all_files)
-        self.filter_edit.textChanged.connect(self.filter_files)
+        self.filter_edit.textChanged.connect(lambda _: self.filter_timer.start())
         self.btn_preview_headers.clicked.connect(self.preview_headers)
         self.btn_add_axis.clicked.connect(self.add_axis_row)
         self.radio_overlay.toggled.connect(self.axis_mode_changed)
@@ -158,12 +676,23 @@ class EngineTestDataExplorer(QMainWindow):
         self.combo_summary_type.currentIndexChanged.connect(self.summary_type_changed)
         self.file_list.itemChanged.connect(self.on_file_checked)
 
+        # Checking several files in a row refreshes the column choices only once
+        self.column_refresh_timer = QTimer(self)
+        self.column_refresh_timer.setSingleShot(True)
+        self.column_refresh_timer.setInterval(150)
+        self.column_refresh_timer.timeout.connect(self.populate_column_choices)
+        # Re-filter the file list once typing pauses
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(120)
+        self.filter_timer.timeout.connect(self.filter_files)
+
         # Advanced: right-click context menu for plot
         self.canvas.setContextMenuPolicy(Qt.CustomContextMenu)
         self.canvas.customContextMenuRequested.connect(self.show_plot_context_menu)
 
         # For advanced summary: custom multi-select dialog
-        self.custom_metrics = ["mean", "median", "min", "max", "std"]
+        self.custom_metrics = list(METRIC_FNS)
         self.custom_metrics_selected = ["mean"]
 
         # Persistent state restore
@@ -263,6 +792,8 @@ class EngineTestDataExplorer(QMainWindow):
         self.combo_summary_type.addItems(["Mean", "Median", "Min/Max", "Std Dev", "Custom…"])
         sum_row1.addWidget(self.combo_summary_type)
         sgl.addLayout(sum_row1)
+        self.chk_summary_float32 = QCheckBox("Single precision (faster; not used for Std Dev)")
+        sgl.addWidget(self.chk_summary_float32)
         # Time window
         time_row = QHBoxLayout()
         time_row.addWidget(QLabel("Time Window:"))
@@ -288,8 +819,11 @@ class EngineTestDataExplorer(QMainWindow):
     def create_plot_pane(self):
         plot_group = QGroupBox("Plot")
         plot_layout = QVBoxLayout(plot_group)
-        self.figure = Figure(figsize=(8, 5))
+        # Constrained layout is solved during the draw itself, no extra tight_layout pass per plot
+        self.figure = Figure(figsize=(8, 5), layout="constrained")
         self.canvas = FigureCanvas(self.figure)
+        # The figure always covers the whole widget, so Qt needn't erase the background first
+        self.canvas.setAttribute(Qt.WA_OpaquePaintEvent)
         plot_layout.addWidget(self.canvas)
         return plot_group
 
@@ -304,6 +838,8 @@ class EngineTestDataExplorer(QMainWindow):
         act_reload = QAction("Reload", self)
         act_reload.setShortcut("Ctrl+R")
         file_menu.addAction(act_reload)
+        act_clear_cache = QAction("Clear Cache", self)
+        file_menu.addAction(act_clear_cache)
         file_menu.addSeparator()
         act_exit = QAction("Exit", self)
         file_menu.addAction(act_exit)
@@ -319,19 +855,20 @@ class EngineTestDataExplorer(QMainWindow):
         self.addToolBar(Qt.TopToolBarArea, toolbar)
         toolbar.addAction(act_open)
         toolbar.addAction(act_reload)
-        act_plot = QAction("Plot", self)
-        act_plot.setShortcut("Ctrl+P")
-        act_export_sum = QAction("Export Summary", self)
-        act_export_sum.setShortcut("Ctrl+S")
-        toolbar.addAction(act_plot)
-        toolbar.addAction(act_export_sum)
+        self.act_plot = QAction("Plot", self)
+        self.act_plot.setShortcut("Ctrl+P")
+        self.act_export_sum = QAction("Export Summary", self)
+        self.act_export_sum.setShortcut("Ctrl+S")
+        toolbar.addAction(self.act_plot)
+        toolbar.addAction(self.act_export_sum)
         # Shortcuts
         act_open.triggered.connect(self.open_folder)
         act_reload.triggered.connect(self.reload_folder)
+        act_clear_cache.triggered.connect(self.clear_cache)
         act_exit.triggered.connect(self.close)
         act_about.triggered.connect(self.show_about_dialog)
-        act_plot.triggered.connect(self.plot_data)
-        act_export_sum.triggered.connect(self.export_summary)
+        self.act_plot.triggered.connect(self.plot_data)
+        self.act_export_sum.triggered.connect(self.export_summary)
 
     def show_about_dialog(self):
         QMessageBox.about(self, "About Engine Test Data Explorer",
@@ -380,12 +917,17 @@ class EngineTestDataExplorer(QMainWindow):
     def scan_folder(self, folder):
         self.file_list.clear()
         self.file_list_data = []
+        self._file_basenames_lower = []
+        self._basenames.clear()
+        self.filtered_files = []
+        self._checked_paths.clear()
         self.status_bar.showMessage("Scanning folder…")
         self.scanning = True
         self.progress_bar = QProgressBar()
         self.status_bar.addPermanentWidget(self.progress_bar)
         self.progress_bar.setRange(0, 0)
         self.scan_thread = FolderScanThread(folder)
+        self.scan_thread.batch.connect(self.folder_scan_batch)
         self.scan_thread.finished.connect(self.folder_scan_complete)
         self.scan_thread.start()
         QTimer.singleShot(60000, lambda: self.abort_scan())
@@ -397,44 +939,84 @@ class EngineTestDataExplorer(QMainWindow):
             self.progress_bar.hide()
             self.scanning = False
 
-    def folder_scan_complete(self, files):
+    def folder_scan_batch(self, files):
+        if self.sender() is not self.scan_thread:
+            return  # late results from a replaced scan
+        start = len(self.file_list_data)
+        self.file_list_data.extend(files)
+        names = [os.path.basename(f) for f in files]
+        self._basenames.update(zip(files, names))
+        self._file_basenames_lower.extend(n.lower() for n in names)
+        self.add_file_items(start)
+        self.status_bar.showMessage(f"Scanning folder… {len(self.file_list_data)} data files found")
+
+    def folder_scan_complete(self, count):
+        if self.sender() is not self.scan_thread:
+            return
         self.status_bar.clearMessage()
         self.progress_bar.hide()
-        self.file_list_data = files
         self.scanning = False
-        self.filter_files()
-        self.status_bar.showMessage(f"Found {len(files)} data files.")
+        self.status_bar.showMessage(f"Found {count} data files.")
         self.save_window_settings()
         self.populate_column_choices()
 
     def filter_files(self):
-        filter_txt = self.filter_edit.text().lower()
         self.file_list.clear()
         self.filtered_files = []
-        for filepath in self.file_list_data:
-            fname = os.path.basename(filepath)
-            if filter_txt in fname.lower():
-                item = QListWidgetItem(fname)
-                item.setCheckState(Qt.Unchecked)
-                item.setToolTip(filepath)
-                self.file_list.addItem(item)
-                self.filtered_files.append(filepath)
+        self.add_file_items()
+        # Hidden files drop out of the selection
+        self.column_refresh_timer.start()
+
+    def add_file_items(self, start=0):
+        """Appends the files from file_list_data[start:] that match the current filter text."""
+        filter_txt = self.filter_edit.text().lower()
+        checked = self._checked_paths
+        names = self._file_basenames_lower
+        matches = [self.file_list_data[i] for i in range(start, len(names)) if filter_txt in names[i]]
+        if not matches:
+            return
+        # One repaint for the whole batch instead of one per item
+        self.file_list.setUpdatesEnabled(False)
+        self.file_list.blockSignals(True)
+        for filepath in matches:
+            item = QListWidgetItem(self._basenames[filepath])
+            item.setCheckState(Qt.Checked if filepath in checked else Qt.Unchecked)
+            item.setToolTip(filepath)
+            item.setData(Qt.UserRole, filepath)
+            self.file_list.addItem(item)
+        self.file_list.blockSignals(False)
+        self.file_list.setUpdatesEnabled(True)
+        self.filtered_files.extend(matches)
 
     def select_all_files(self):
-        for i in range(self.file_list.count()):
-            self.file_list.item(i).setCheckState(Qt.Checked)
+        self.set_all_check_states(Qt.Checked)
     def deselect_all_files(self):
+        self.set_all_check_states(Qt.Unchecked)
+    def set_all_check_states(self, state):
+        # Without itemChanged per item, so the column choices are refreshed once
+        self.file_list.setUpdatesEnabled(False)
+        self.file_list.blockSignals(True)
+        item = self.file_list.item
         for i in range(self.file_list.count()):
-            self.file_list.item(i).setCheckState(Qt.Unchecked)
+            item(i).setCheckState(state)
+        self.file_list.blockSignals(False)
+        self.file_list.setUpdatesEnabled(True)
+        if state == Qt.Checked:
+            self._checked_paths.update(self.filtered_files)
+        else:
+            self._checked_paths.difference_update(self.filtered_files)
+        self.column_refresh_timer.stop()
+        self.populate_column_choices()
     def get_selected_files(self):
-        selected = []
-        for i in range(self.file_list.count()):
-            item = self.file_list.item(i)
-            if item.checkState() == Qt.Checked:
-                selected.append(self.filtered_files[i])
-        return selected
+        checked = self._checked_paths
+        return [f for f in self.filtered_files if f in checked]
     def on_file_checked(self, item):
-        self.populate_column_choices()
+        filepath = item.data(Qt.UserRole)
+        if item.checkState() == Qt.Checked:
+            self._checked_paths.add(filepath)
+        else:
+            self._checked_paths.discard(filepath)
+        self.column_refresh_timer.start()
 
     # ============ Header preview ============
     def preview_headers(self):
@@ -442,7 +1024,7 @@ class EngineTestDataExplorer(QMainWindow):
         if not files:
             QMessageBox.information(self, "Preview Headers", "No files selected.")
             return
-        dlg = HeaderPreviewDialog(files, self)
+        dlg = HeaderPreviewDialog(files, self.decimal_sep_combo.currentText(), self)
         dlg.exec_()
 
     # ============ Dynamic Axis Table ============
@@ -501,25 +1083,30 @@ class EngineTestDataExplorer(QMainWindow):
         # For future: Save combo selection changes if needed
         pass
 
+    def get_file_columns(self, filepath, decimal_sep):
+        """(columns, numeric columns) of a file, re-read only when its mtime or the decimal separator changes."""
+        try:
+            mtime = os.path.getmtime(filepath)
+            cached = self._header_cache.get(filepath)
+            if cached is not None and cached[0] == mtime and cached[1] == decimal_sep:
+                return cached[2]
+            info = sniff_file_columns(filepath, decimal_sep)
+        except Exception:
+            return [], []
+        self._header_cache[filepath] = (mtime, decimal_sep, info)
+        return info
+
     def populate_column_choices(self):
         selected_files = self.get_selected_files()
-        if not selected_files:
-            all_columns = []
-        else:
-            all_columns = unique_numeric_columns(selected_files)
-        if not all_columns:
-            all_columns = []
+        decimal_sep = self.decimal_sep_combo.currentText()
+        numeric_cols = set()
         # For time/date combobox
         dt_cols = set()
-        decimal_sep = self.decimal_sep_combo.currentText()
         for f in selected_files:
-            try:
-                df = pd.read_csv(f, sep='\t', nrows=5, decimal=decimal_sep)
-                for c in df.columns:
-                    if is_time_col(c):
-                        dt_cols.add(c)
-            except Exception:
-                continue
+            columns, numeric = self.get_file_columns(f, decimal_sep)
+            numeric_cols.update(numeric)
+            dt_cols.update(c for c in columns if is_time_col(c))
+        all_columns = sorted(numeric_cols)
         # Default fallback
         if not dt_cols and all_columns:
             dt_cols.add(all_columns[0])
@@ -537,21 +1124,155 @@ class EngineTestDataExplorer(QMainWindow):
                 cb.setCurrentIndex(i if i < len(all_columns) else 0)
 
     # ============ DataFrame loading ============
-    def load_selected_dataframes(self):
-        """Loads all selected files and keeps them in self.loaded_dfs, with exception handling."""
+    def load_selected_dataframes(self, on_loaded, wanted_cols=None):
+        """Loads all selected files into self.loaded_dfs on a background thread, then calls on_loaded().
+
+        Only wanted_cols are parsed when given. Files whose mtime and decimal separator match
+        a cached parse holding those columns are not read again; the rest are parsed in parallel.
+        """
+        if self.loading:
+            self.status_bar.showMessage("Files are still loading; try again when the load has finished.", 4000)
+            return
         files = self.get_selected_files()
         loaded = {}
         errors = []
         decimal_sep = self.decimal_sep_combo.currentText()
+        to_load = []
         for f in files:
             try:
-                df = pd.read_csv(filepath, sep='\t', decimal=decimal_sep)
-                loaded[f] = df
+                mtime = os.path.getmtime(f)
             except Exception as e:
                 errors.append(f"{os.path.basename(f)}: {e}")
-        self.loaded_dfs = loaded
+                continue
+            cached = self._df_cache.get(f)
+            if cached is not None and cached[0] == mtime and cached[1] == decimal_sep:
+                cached_cols = cached[2]
+                if cached_cols is None or (wanted_cols is not None and wanted_cols <= cached_cols):
+                    self._df_cache.move_to_end(f)
+                    loaded[f] = cached[3]
+                    continue
+                # Re-read the union so alternating column choices don't thrash the cache
+                columns = None if wanted_cols is None else frozenset(wanted_cols) | cached_cols
+            else:
+                columns = None if wanted_cols is None else frozenset(wanted_cols)
+            to_load.append((f, mtime, columns))
+        self._pending_load = (files, loaded, errors, decimal_sep, on_loaded)
+        if not to_load:
+            self.data_load_complete({}, [])
+            return
+        self.loading = True
+        self.set_data_actions_enabled(False)
+        self.status_bar.showMessage(f"Loading {len(to_load)} file(s)…")
+        self.load_progress_bar.setRange(0, len(to_load))
+        self.load_progress_bar.setValue(0)
+        self.load_progress_bar.show()
+        self.load_thread = DataLoadThread(to_load, decimal_sep)
+        self.load_thread.progress.connect(self.data_load_progress)
+        self.load_thread.finished.connect(self.data_load_complete)
+        self.load_thread.start()
+
+    def data_load_progress(self, done, total):
+        self.load_progress_bar.setValue(done)
+        self.status_bar.showMessage(f"Loading files… {done}/{total}")
+
+    def data_load_complete(self, parsed, errors):
+        files, loaded, load_errors, decimal_sep, on_loaded = self._pending_load
+        self._pending_load = None
+        for f, (mtime, columns, df) in parsed.items():
+            self._df_cache[f] = (mtime, decimal_sep, columns, df)
+            self._df_cache.move_to_end(f)
+            loaded[f] = df
+        self.trim_df_cache()
+        self.loaded_dfs = {f: loaded[f] for f in files if f in loaded}
+        if self.loading:
+            self.loading = False
+            self.load_progress_bar.hide()
+            self.status_bar.clearMessage()
+            self.set_data_actions_enabled(True)
+        errors = load_errors + errors
         if errors:
             QMessageBox.warning(self, "File Load Errors", "\n".join(errors))
+        on_loaded()
+
+    def set_data_actions_enabled(self, enabled):
+        for w in (self.btn_plot, self.btn_export_csv, self.btn_preview_summary, self.btn_export_summary,
+                  self.act_plot, self.act_export_sum):
+            w.setEnabled(enabled)
+
+    def clear_cache(self):
+        """Drops parsed files from memory and deletes the sidecar files of the current folder."""
+        if self.loading:
+            return
+        removed = 0
+        for f in self.file_list_data:
+            try:
+                os.remove(f + SIDECAR_EXT)
+                removed += 1
+            except OSError:
+                pass
+        self._df_cache.clear()
+        self._header_cache.clear()
+        self._numeric_cache.clear()
+        self._last_summary = None
+        self.status_bar.showMessage(f"Cache cleared ({removed} sidecar files removed).", 4000)
+
+    def trim_df_cache(self):
+        """Evicts least recently used DataFrames beyond the file-count/memory limits."""
+        sizes = {f: entry[3].memory_usage(index=True).sum() for f, entry in self._df_cache.items()}
+        total = sum(sizes.values())
+        while len(self._df_cache) > 1 and (len(self._df_cache) > DF_CACHE_MAX_FILES or total > DF_CACHE_MAX_BYTES):
+            f, _ = self._df_cache.popitem(last=False)
+            self._numeric_cache.pop(f, None)
+            self._last_summary = None
+            total -= sizes[f]
+
+    def numeric_frame(self, filepath, df, cols):
+        """Numeric versions of the given columns of a loaded file, each converted once until it is reloaded."""
+        cached = self._numeric_cache.get(filepath)
+        if cached is None or cached[0] is not df:
+            cached = (df, pd.DataFrame(index=df.index))
+            self._numeric_cache[filepath] = cached
+        num = cached[1]
+        available, done = set(df.columns), set(num.columns)
+        for c in cols:
+            if c in available and c not in done:
+                num[c] = df[c] if pd.api.types.is_numeric_dtype(df[c]) else pd.to_numeric(df[c], errors="coerce")
+                done.add(c)
+        return num
+
+    def summarize_file(self, filepath, time_col, cols, metric_types, start, end, out, dtype):
+        """Writes the summary row of one loaded file into out; False if it has no time column."""
+        df = self.loaded_dfs.get(filepath)
+        if df is None or time_col not in df.columns: return False
+        rows = time_window_rows(extract_datetime_col(df, time_col).to_numpy(), start, end)
+        summarize_columns(self.numeric_frame(filepath, df, cols), cols, rows, metric_types, out, dtype)
+        return True
+
+    def compute_summary(self, files, time_col, axis_map, metric_types, start, end):
+        """(file names, column headers, values) of the summary table; repeated requests reuse the last result."""
+        # Requested columns and headers depend only on the axes and metrics, not on the file
+        cols = [c for _, c in axis_map]
+        columns = ["File"] + [f"{col}-{mt}" for col in cols for mt in metric_types]
+        # float32 is enough for mean/median/min/max of telemetry; std stays in double precision
+        dtype = np.float32 if self.chk_summary_float32.isChecked() and "std" not in metric_types else np.float64
+        key = (tuple(files), time_col, tuple(cols), tuple(metric_types), start, end, dtype)
+        dfs = [self.loaded_dfs.get(f) for f in files]
+        # Reloaded files are new DataFrame objects, so identity tells whether the data changed
+        if self._last_summary is not None and self._last_summary[0] == key and \
+                all(a is b for a, b in zip(self._last_summary[1], dfs)):
+            return self._last_summary[2]
+        # One row of metrics per file, filled in place by the workers; map keeps the file order
+        values = np.empty((len(files), len(cols) * len(metric_types)), dtype=np.float64)
+        n_workers = max(1, min(MAX_SUMMARY_WORKERS, os.cpu_count() or 1, len(files)))
+        def fill(i):
+            return self.summarize_file(files[i], time_col, cols, metric_types, start, end, values[i], dtype)
+        with ThreadPoolExecutor(max_workers=n_workers) as ex:
+            kept = np.fromiter(ex.map(fill, range(len(files))), dtype=bool, count=len(files))
+        values = values[kept]
+        file_names = [self._basenames.get(f) or os.path.basename(f) for f, k in zip(files, kept) if k]
+        result = (file_names, columns, values)
+        self._last_summary = (key, dfs, result)
+        return result
 
     # ============ Utility: Get axis/column mapping ============
     def get_axis_column_mapping(self):
@@ -563,6 +1284,9 @@ class EngineTestDataExplorer(QMainWindow):
             mapping.append((axis_name, col))
         return mapping
 
+    def get_wanted_columns(self, time_col, axis_map):
+        return {time_col} | {c for _, c in axis_map if c}
+
     # ============ Utility: Get selected time column ============
     def get_selected_time_column(self):
         return self.combo_datetime.currentText()
@@ -578,7 +1302,6 @@ class EngineTestDataExplorer(QMainWindow):
 
     # ============ Plotting ============
     def plot_data(self):
-        self.load_selected_dataframes()
         files = self.get_selected_files()
         if not files:
             QMessageBox.information(self, "Plot", "No files selected.")
@@ -588,15 +1311,41 @@ class EngineTestDataExplorer(QMainWindow):
         if not time_col or not any(c for _, c in axis_map):
             QMessageBox.warning(self, "Missing Columns", "You must select a Date/Time column and at least one data column.")
             return
+        self.load_selected_dataframes(lambda: self.draw_plot(files, time_col, axis_map),
+                                      self.get_wanted_columns(time_col, axis_map))
 
+    def draw_plot(self, files, time_col, axis_map):
         overlay = self.radio_overlay.isChecked()
         autoscale = self.chk_autoscale.isChecked()
+        # (axis index, column, file) for every line that will be drawn
+        series = []
+        for idx, (axis_name, col) in enumerate(axis_map):
+            if not col: continue
+            for f in files:
+                df = self.loaded_dfs.get(f)
+                if df is None or col not in df.columns or time_col not in df.columns:
+                    continue
+                series.append((idx, col, f))
+        arrays = self.prepare_plot_arrays(series, time_col)
+        layout = (overlay, tuple(axis_map), tuple(series))
+        if layout == self._plot_layout:
+            # Same axes and lines as last time: only swap the data in
+            for (idx, col, f), line in self._line_artists.items():
+                line.set_data(*arrays[(f, col)])
+            for ax in self._plot_axes:
+                ax.relim()
+                ax.autoscale_view()
+                if autoscale: ax.autoscale()
+            self.canvas.draw_idle()
+            self.status_bar.showMessage("Plot complete.", 3000)
+            return
         self.figure.clear()
+        self._plot_layout = None
+        self._line_artists = {}
+        self._plot_axes = []
+        colors = ['tab:blue', 'tab:orange', 'tab:green', 'tab:red']
         if overlay:
             ax_main = self.figure.add_subplot(111)
-            axes = [ax_main]
-            colors = ['tab:blue', 'tab:orange', 'tab:green', 'tab:red']
-            twin_axes = [ax_main]
             for idx, (axis_name, col) in enumerate(axis_map):
                 if not col: continue
                 if idx == 0:
@@ -605,54 +1354,72 @@ class EngineTestDataExplorer(QMainWindow):
                     ax = ax_main.twinx()
                     # To avoid overlapping, offset right
                     ax.spines["right"].set_position(("axes", 1 + 0.07 * (idx - 1)))
-                twin_axes.append(ax)
-                color = colors[idx % len(colors)]
-                label = f"{col}"
-                for f in files:
-                    df = self.loaded_dfs.get(f)
-                    if df is None or col not in df.columns or time_col not in df.columns:
-                        continue
-                    tsec = extract_datetime_col(df, time_col)
-                    y = pd.to_numeric(df[col], errors="coerce")
-                    ax.plot(tsec, y, label=f"{os.path.basename(f)}:{col}", color=color)
-                ax.set_ylabel(col)
+                self._plot_axes.append(ax)
+                self.plot_axis_series(ax, idx, col, series, arrays, colors[idx % len(colors)])
                 if autoscale: ax.autoscale()
             ax_main.set_xlabel("Time [s]")
             ax_main.legend(loc="upper right")
-            self.figure.tight_layout()
         else:
             n_axes = sum(1 for _, col in axis_map if col)
             if n_axes == 0:
                 QMessageBox.warning(self, "No Data", "No columns selected.")
                 return
-            axes = []
-            colors = ['tab:blue', 'tab:orange', 'tab:green', 'tab:red']
             for idx, (axis_name, col) in enumerate(axis_map):
                 if not col: continue
-                ax = self.figure.add_subplot(n_axes, 1, len(axes)+1)
-                axes.append(ax)
-                color = colors[idx % len(colors)]
-                for f in files:
-                    df = self.loaded_dfs.get(f)
-                    if df is None or col not in df.columns or time_col not in df.columns:
-                        continue
-                    tsec = extract_datetime_col(df, time_col)
-                    y = pd.to_numeric(df[col], errors="coerce")
-                    ax.plot(tsec, y, label=f"{os.path.basename(f)}:{col}", color=color)
-                ax.set_ylabel(col)
+                ax = self.figure.add_subplot(n_axes, 1, len(self._plot_axes)+1)
+                self._plot_axes.append(ax)
+                self.plot_axis_series(ax, idx, col, series, arrays, colors[idx % len(colors)])
                 if autoscale: ax.autoscale()
                 ax.legend(loc="upper right")
-            axes[-1].set_xlabel("Time [s]")
-            self.figure.tight_layout()
-        self.canvas.draw()
+            self._plot_axes[-1].set_xlabel("Time [s]")
+        self._plot_layout = layout
+        self.canvas.draw_idle()
         self.status_bar.showMessage("Plot complete.", 3000)
 
+    def plot_axis_series(self, ax, idx, col, series, arrays, color):
+        """Draws every file's line for one axis entry and remembers the artists for later set_data updates."""
+        for key in series:
+            if key[0] != idx:
+                continue
+            f = key[2]
+            tsec, y = arrays[(f, col)]
+            line, = ax.plot(tsec, y, label=f"{self._basenames.get(f) or os.path.basename(f)}:{col}", color=color)
+            self._line_artists[key] = line
+        ax.set_ylabel(col)
+
+    def prepare_plot_arrays(self, series, time_col):
+        """{(filename, column): (time, values)} float64 arrays, downsampled for very long series.
+
+        Each time column is converted once per file, and the result is reused while the
+        series, time column and loaded DataFrames stay the same.
+        """
+        key = (time_col, tuple(series))
+        dfs = [self.loaded_dfs[f] for _, _, f in series]
+        if self._plot_arrays is not None:
+            last_key, last_dfs, arrays = self._plot_arrays
+            if last_key == key and all(a is b for a, b in zip(last_dfs, dfs)):
+                return arrays
+        arrays = {}
+        times = {}
+        for _, col, f in series:
+            if (f, col) in arrays:
+                continue
+            df = self.loaded_dfs[f]
+            if f not in times:
+                times[f] = extract_datetime_col(df, time_col).to_numpy(dtype=np.float64)
+            y = pd.to_numeric(df[col], errors="coerce").to_numpy(dtype=np.float64)
+            arrays[(f, col)] = downsample_series(times[f], y)
+        # The DataFrames are kept referenced so the identity check above stays valid
+        self._plot_arrays = (key, dfs, arrays)
+        return arrays
+
     # ============ Right-click context menu ============
     def show_plot_context_menu(self, pos):
         menu = QMenu(self)
         menu.addAction("Save as PNG", self.export_plot_png)
-        menu.addAction("Export Plot Data to CSV", self.export_plot_csv)
-        menu.addAction("Export Current Summary", self.export_summary)
+        # Both need the files loaded, which can't start while a load is running
+        menu.addAction("Export Plot Data to CSV", self.export_plot_csv).setEnabled(not self.loading)
+        menu.addAction("Export Current Summary", self.export_summary).setEnabled(not self.loading)
         menu.exec_(QCursor.pos())
 
     def export_plot_png(self):
@@ -662,22 +1429,43 @@ class EngineTestDataExplorer(QMainWindow):
         self.status_bar.showMessage(f"Plot exported: {fname}", 4000)
 
     def export_plot_csv(self):
-        self.load_selected_dataframes()
         files = self.get_selected_files()
         if not files:
             QMessageBox.information(self, "Export", "No files selected.")
             return
         time_col = self.get_selected_time_column()
         axis_map = self.get_axis_column_mapping()
+        self.load_selected_dataframes(lambda: self.write_plot_csv(files, time_col, axis_map),
+                                      self.get_wanted_columns(time_col, axis_map))
+
+    def full_precision_columns(self, filepath, df, cols):
+        """The given columns of a loaded file as parsed, undoing shrink_dtypes' float32 rounding.
+
+        Downcast columns are read again (from the sidecar when there is one); if that fails or the
+        file no longer lines up with the loaded frame, the loaded values are used.
+        """
+        narrowed = frozenset(c for c in cols if df[c].dtype == np.float32)
+        full = None
+        if narrowed:
+            try:
+                full = load_data_file(filepath, self.decimal_sep_combo.currentText(), narrowed)
+            except Exception:
+                full = None
+            if full is not None and len(full) != len(df):
+                full = None
+        return {c: full[c].to_numpy() if full is not None and c in narrowed and c in full.columns else df[c]
+                for c in cols}
+
+    def write_plot_csv(self, files, time_col, axis_map):
         out = []
         for f in files:
             df = self.loaded_dfs.get(f)
             if df is None or time_col not in df.columns: continue
             outdf = pd.DataFrame()
             outdf["Time [s]"] = extract_datetime_col(df, time_col)
-            for _, col in axis_map:
-                if col and col in df.columns:
-                    outdf[col] = pd.to_numeric(df[col], errors="coerce")
+            cols = [col for _, col in axis_map if col and col in df.columns]
+            for col, values in self.full_precision_columns(f, df, cols).items():
+                outdf[col] = pd.to_numeric(values, errors="coerce")
             out.append(outdf)
         if not out:
             QMessageBox.warning(self, "Export", "No data to export.")
@@ -690,7 +1478,6 @@ class EngineTestDataExplorer(QMainWindow):
 
     # ============ Summary Statistics ============
     def preview_summary(self):
-        self.load_selected_dataframes()
         files = self.get_selected_files()
         if not files:
             QMessageBox.information(self, "Summary", "No files selected.")
@@ -699,47 +1486,28 @@ class EngineTestDataExplorer(QMainWindow):
         axis_map = self.get_axis_column_mapping()
         metric_types = self.get_selected_summary_metrics()
         start, end = self.get_time_window()
-        summary_rows = []
-        columns = []
-        for f in files:
-            df = self.loaded_dfs.get(f)
-            if df is None or time_col not in df.columns: continue
-            tsec = extract_datetime_col(df, time_col)
-            mask = pd.Series([True]*len(df))
-            if start is not None:
-                mask &= (tsec >= start)
-            if end is not None:
-                mask &= (tsec <= end)
-            row = [os.path.basename(f)]
-            for _, col in axis_map:
-                vals = pd.to_numeric(df[col][mask], errors="coerce") if col in df.columns else pd.Series([])
-                for mt in metric_types:
-                    if mt == "mean":
-                        row.append(vals.mean() if not vals.empty else np.nan)
-                    elif mt == "median":
-                        row.append(vals.median() if not vals.empty else np.nan)
-                    elif mt == "min":
-                        row.append(vals.min() if not vals.empty else np.nan)
-                    elif mt == "max":
-                        row.append(vals.max() if not vals.empty else np.nan)
-                    elif mt == "std":
-                        row.append(vals.std() if not vals.empty else np.nan)
-            summary_rows.append(row)
-        # Compose columns
-        columns = ["File"]
-        for _, col in axis_map:
-            for mt in metric_types:
-                columns.append(f"{col}-{mt}")
+        self.load_selected_dataframes(lambda: self.show_summary(files, time_col, axis_map, metric_types, start, end),
+                                      self.get_wanted_columns(time_col, axis_map))
+
+    def show_summary(self, files, time_col, axis_map, metric_types, start, end):
+        file_names, columns, values = self.compute_summary(files, time_col, axis_map, metric_types, start, end)
         # Show summary in modal table
         dlg = QDialog(self)
         dlg.setWindowTitle("Summary Preview")
         lay = QVBoxLayout(dlg)
-        table = QTableWidget(len(summary_rows), len(columns))
+        table = QTableWidget(len(file_names), len(columns))
         table.setHorizontalHeaderLabels(columns)
-        for i, row in enumerate(summary_rows):
-            for j, val in enumerate(row):
-                item = QTableWidgetItem("" if pd.isnull(val) else str(np.round(val, 6)))
-                table.setItem(i, j, item)
+        # Format every cell in one go, then fill without per-item signals or repaints
+        text = np.where(np.isnan(values), "", np.round(values, 6).astype(str))
+        table.setSortingEnabled(False)
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        for i, row in enumerate(text):
+            table.setItem(i, 0, QTableWidgetItem(file_names[i]))
+            for j, cell in enumerate(row, 1):
+                table.setItem(i, j, QTableWidgetItem(cell))
+        table.blockSignals(False)
+        table.setUpdatesEnabled(True)
         lay.addWidget(table)
         btn = QPushButton("Close")
         btn.clicked.connect(dlg.accept)
@@ -765,23 +1533,13 @@ class EngineTestDataExplorer(QMainWindow):
         return ["mean"]
 
     def get_time_window(self):
+        # Only numbers are used as seconds; blank or anything else leaves that end of the window open
         def parse_time(s):
             s = s.strip()
-            if not s: return None
-            try:
-                return float(s)
-            except Exception:
-                try:
-                    return pd.to_datetime(s)
-                except Exception:
-                    return None
-        s = parse_time(self.start_time_edit.text())
-        e = parse_time(self.end_time_edit.text())
-        # If both float: use as seconds, else None
-        return (s if isinstance(s, float) else None, e if isinstance(e, float) else None)
+            return float(s) if _FLOAT_RE.match(s) else None
+        return parse_time(self.start_time_edit.text()), parse_time(self.end_time_edit.text())
 
     def export_summary(self):
-        self.load_selected_dataframes()
         files = self.get_selected_files()
         if not files:
             QMessageBox.information(self, "Export", "No files selected.")
@@ -790,44 +1548,25 @@ class EngineTestDataExplorer(QMainWindow):
         axis_map = self.get_axis_column_mapping()
         metric_types = self.get_selected_summary_metrics()
         start, end = self.get_time_window()
-        summary_rows = []
-        columns = []
-        for f in files:
-            df = self.loaded_dfs.get(f)
-            if df is None or time_col not in df.columns: continue
-            tsec = extract_datetime_col(df, time_col)
-            mask = pd.Series([True]*len(df))
-            if start is not None:
-                mask &= (tsec >= start)
-            if end is not None:
-                mask &= (tsec <= end)
-            row = [os.path.basename(f)]
-            for _, col in axis_map:
-                vals = pd.to_numeric(df[col][mask], errors="coerce") if col in df.columns else pd.Series([])
-                for mt in metric_types:
-                    if mt == "mean":
-                        row.append(vals.mean() if not vals.empty else np.nan)
-                    elif mt == "median":
-                        row.append(vals.median() if not vals.empty else np.nan)
-                    elif mt == "min":
-                        row.append(vals.min() if not vals.empty else np.nan)
-                    elif mt == "max":
-                        row.append(vals.max() if not vals.empty else np.nan)
-                    elif mt == "std":
-                        row.append(vals.std() if not vals.empty else np.nan)
-            summary_rows.append(row)
-        columns = ["File"]
-        for _, col in axis_map:
-            for mt in metric_types:
-                columns.append(f"{col}-{mt}")
+        self.load_selected_dataframes(lambda: self.write_summary(files, time_col, axis_map, metric_types, start, end),
+                                      self.get_wanted_columns(time_col, axis_map))
+
+    def write_summary(self, files, time_col, axis_map, metric_types, start, end):
+        file_names, columns, values = self.compute_summary(files, time_col, axis_map, metric_types, start, end)
         fname = self.get_save_filepath("Export Summary Table", "CSV Files (*.csv);;Excel Files (*.xlsx);;All Files (*)")
         if not fname: return
-        df_out = pd.DataFrame(summary_rows, columns=columns)
         try:
             if fname.lower().endswith(".xlsx"):
+                df_out = pd.DataFrame(values, columns=columns[1:], copy=False)
+                df_out.insert(0, "File", np.array(file_names, dtype=object))
                 df_out.to_excel(fname, index=False)
             else:
-                df_out.to_csv(fname, index=False)
+                # Small all-float table: write rows directly rather than through the pandas formatter
+                with open(fname, "w", newline="", encoding="utf-8") as fh:
+                    w = csv.writer(fh, lineterminator=os.linesep)
+                    w.writerow(columns)
+                    for name, row in zip(file_names, values.tolist()):
+                        w.writerow([name] + ["" if v != v else repr(v) for v in row])
             self.status_bar.showMessage(f"Summary exported: {fname}", 4000)
         except Exception as e:
             QMessageBox.critical(self, "Export Error", str(e))
@@ -839,7 +1578,7 @@ class EngineTestDataExplorer(QMainWindow):
 
     # ============ MAIN ============
 def main():
-    import warnings
+    # All-NaN summary windows are expected and already reported as empty cells
     warnings.filterwarnings("ignore")
     app = QApplication(sys.argv)
     app.setStyle("Fusion")